@@ -4,23 +4,64 @@ Sensor interface for elevator safety inspection
 
 import logging
 import random
-from typing import Dict, Any, Optional, Union
+import threading
+import time
+from array import array
+from typing import Dict, Any, Iterable, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch reads fall back to per-sensor simulation
+    np = None
 
 logger = logging.getLogger('elevator_safety')
 
+# Kinds of simulated sensor, as stored in SensorManager._kind_idx
+_KIND_ANALOG = 0
+_KIND_BOOL = 1
+
+# Number of precomputed uniform samples drawn at a time for scalar readings
+_LUT_SIZE = 1 << 16
+
 
 class SensorManager:
     """Manages connections to and readings from elevator sensors"""
     
-    def __init__(self, sensor_config: Dict[str, Any]):
+    def __init__(self, sensor_config: Dict[str, Any], cache_ttl: float = 1.0,
+                 seed: Optional[int] = None):
         """
         Initialize with sensor configuration
         
         Args:
             sensor_config: Dictionary containing sensor configurations
+            cache_ttl: Seconds a reading is reused before the sensor is read
+                again (a sensor's own 'cache_ttl' setting takes precedence)
+            seed: Seed for simulated readings, so an inspection can be
+                replayed exactly (random if None)
         """
         self.sensor_config = sensor_config
         self.connected_sensors = {}
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_ttl = cache_ttl
+        # Each manager draws from its own generator instead of the global one
+        self._rng = np.random.default_rng(seed) if np is not None else random.Random(seed)
+        self._batch_index: Dict[str, int] = {}
+        if np is not None:
+            # Empty until connect_sensors lays out the connected sensors
+            self._kind_idx = np.empty(0, dtype=np.int8)
+            self._base = np.empty(0, dtype=float)
+            self._var = np.empty(0, dtype=float)
+            self._failure_rate = np.empty(0, dtype=float)
+        # Lookup table of uniform samples, filled on first use
+        self._lut = array('f')
+        self._lut_pos = 0
+        # Guards the generator and the lookup table position, which readers
+        # in several threads and the poller share
+        self._sample_lock = threading.Lock()
+        # Latest readings from the background poller, while one is running
+        self._latest: Dict[str, Any] = {}
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
         logger.debug(f"Initialized sensor manager with {len(sensor_config)} sensors")
     
     def connect_sensors(self) -> bool:
@@ -30,26 +71,52 @@ class SensorManager:
         Returns:
             True if all sensors connected successfully, False otherwise
         """
-        success = True
+        # Validate configurations first so bad entries are reported by name
+        invalid = set()
         for sensor_id, config in self.sensor_config.items():
-            try:
-                # In a real implementation, this would establish actual connections
-                # to physical sensors or sensor APIs
-                logger.info(f"Connecting to sensor: {sensor_id} ({config['type']})")
-                
-                # Simulate connection success
-                self.connected_sensors[sensor_id] = {
+            if not isinstance(config, dict) or 'type' not in config:
+                logger.error(f"Failed to connect to sensor {sensor_id}: no sensor type configured")
+                invalid.add(sensor_id)
+        
+        try:
+            # In a real implementation, this would establish actual connections
+            # to physical sensors or sensor APIs
+            
+            # Simulate connection success
+            self.connected_sensors = {
+                sensor_id: {
                     "type": config['type'],
                     "connected": True,
-                    "config": config
+                    "config": config,
+                    "sim": self._SIMULATORS.get(config['type']),
+                    "cache_ttl": config.get('cache_ttl', self._cache_ttl)
                 }
-                
-                logger.debug(f"Successfully connected to sensor: {sensor_id}")
-            except Exception as e:
-                logger.error(f"Failed to connect to sensor {sensor_id}: {str(e)}")
-                success = False
+                for sensor_id, config in self.sensor_config.items()
+                if sensor_id not in invalid
+            }
+        except Exception as e:
+            logger.exception(f"Failed to connect to sensors: {str(e)}")
+            return False
+        
+        logger.info(f"Connected to {len(self.connected_sensors)} sensors")
+        self._build_batch_tables()
+        return not invalid
+    
+    def _build_batch_tables(self) -> None:
+        """Lay out simulation parameters of connected sensors as parallel arrays"""
+        self._batch_index = {
+            sensor_id: i for i, sensor_id in enumerate(self.connected_sensors)
+        }
+        if np is None:
+            return
         
-        return success
+        params = [self._simulation_params(sensor['type'], sensor['config'])
+                  for sensor in self.connected_sensors.values()]
+        kinds, bases, variations, failure_rates = zip(*params) if params else ((), (), (), ())
+        self._kind_idx = np.array(kinds, dtype=np.int8)
+        self._base = np.array(bases, dtype=float)
+        self._var = np.array(variations, dtype=float)
+        self._failure_rate = np.array(failure_rates, dtype=float)
     
     def get_reading(self, sensor_id: str) -> Optional[Union[float, bool, str]]:
         """
@@ -65,76 +132,222 @@ class SensorManager:
             logger.warning(f"Attempted to read from unknown sensor: {sensor_id}")
             return None
         
+        if self._poll_thread is not None:
+            return self._latest.get(sensor_id)
+        
         sensor = self.connected_sensors[sensor_id]
         
+        # Reuse a recent reading rather than polling the sensor again
+        now = time.monotonic()
+        cached = self._cache.get(sensor_id)
+        if cached is not None and now - cached[0] < sensor['cache_ttl']:
+            return cached[1]
+        
         try:
-            # In a real implementation, this would get actual readings from sensors
-            # For simulation, generate reasonable values based on sensor type
-            if sensor['type'] == 'temperature':
-                value = self._simulate_temperature_reading(sensor['config'])
-            elif sensor['type'] == 'pressure':
-                value = self._simulate_pressure_reading(sensor['config'])
-            elif sensor['type'] == 'vibration':
-                value = self._simulate_vibration_reading(sensor['config'])
-            elif sensor['type'] == 'speed':
-                value = self._simulate_speed_reading(sensor['config'])
-            elif sensor['type'] == 'weight':
-                value = self._simulate_weight_reading(sensor['config'])
-            elif sensor['type'] == 'door_sensor':
-                value = self._simulate_door_sensor_reading(sensor['config'])
-            elif sensor['type'] == 'emergency_button':
-                value = self._simulate_emergency_button_reading(sensor['config'])
-            else:
-                logger.warning(f"Unknown sensor type: {sensor['type']}")
-                value = 0
+            value = self._simulate_reading(sensor)
             
-            logger.debug(f"Sensor {sensor_id} reading: {value}")
+            self._cache[sensor_id] = (now, value)
+            logger.debug("Sensor %s reading: %s", sensor_id, value)
             return value
             
         except Exception as e:
             logger.error(f"Error reading from sensor {sensor_id}: {str(e)}")
             return None
     
+    def get_readings_batch(self, sensor_ids: Iterable[str]) -> Dict[str, Optional[Union[float, bool, str]]]:
+        """
+        Take a fresh reading from several sensors at once
+        
+        With NumPy available all readings are drawn in a single vectorized
+        pass; otherwise each sensor is simulated in turn. The readings also
+        refresh the cache used by get_reading.
+        
+        Args:
+            sensor_ids: Identifiers for the sensors
+            
+        Returns:
+            Dictionary mapping each sensor ID to its reading, or None if the
+            sensor is not available
+        """
+        readings = {}
+        known = []
+        for sensor_id in sensor_ids:
+            if sensor_id in self._batch_index:
+                known.append(sensor_id)
+            else:
+                logger.warning(f"Attempted to read from unknown sensor: {sensor_id}")
+                readings[sensor_id] = None
+        
+        if not known:
+            return readings
+        
+        now = time.monotonic()
+        if np is None:
+            values = [self._simulate_reading(self.connected_sensors[sensor_id])
+                      for sensor_id in known]
+        else:
+            idx = np.array([self._batch_index[sensor_id] for sensor_id in known], dtype=np.intp)
+            with self._sample_lock:
+                u = self._rng.random(len(idx))
+            analog = self._base[idx] + self._var[idx] * u
+            passed = u > self._failure_rate[idx]
+            values = [ok if kind == _KIND_BOOL else reading
+                      for kind, reading, ok in zip(self._kind_idx[idx].tolist(),
+                                                   analog.tolist(), passed.tolist())]
+        
+        for sensor_id, value in zip(known, values):
+            self._cache[sensor_id] = (now, value)
+            readings[sensor_id] = value
+        
+        return readings
+    
+    def start_polling(self, interval: float = 0.1) -> None:
+        """
+        Refresh all sensor readings in a background thread
+        
+        While polling, get_reading returns the latest polled value instead
+        of reading the sensor on demand.
+        
+        Args:
+            interval: Seconds between polls
+        """
+        if self._poll_thread is not None:
+            return
+        
+        # Take a first set of readings so they are available immediately
+        self._latest = self.get_readings_batch(self.connected_sensors)
+        self._poll_stop.clear()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop, args=(interval,),
+            name="sensor-poller", daemon=True
+        )
+        self._poll_thread.start()
+        logger.debug("Started sensor polling every %s s", interval)
+    
+    def stop_polling(self) -> None:
+        """Stop the background poller, returning to on-demand readings"""
+        if self._poll_thread is None:
+            return
+        
+        self._poll_stop.set()
+        self._poll_thread.join()
+        self._poll_thread = None
+        logger.debug("Stopped sensor polling")
+    
+    def _poll_loop(self, interval: float) -> None:
+        """Poll every connected sensor until asked to stop"""
+        while not self._poll_stop.wait(interval):
+            try:
+                # Swap in a whole new dict so readers never see a partial poll
+                self._latest = self.get_readings_batch(self.connected_sensors)
+            except Exception as e:
+                logger.error(f"Error polling sensors: {str(e)}")
+    
+    def _simulate_reading(self, sensor: Dict[str, Any]) -> Union[float, bool]:
+        """Simulate a single reading for a connected sensor"""
+        # In a real implementation, this would get actual readings from sensors
+        # For simulation, generate reasonable values based on sensor type
+        sim = sensor['sim']
+        if sim is None:
+            logger.warning(f"Unknown sensor type: {sensor['type']}")
+            return 0
+        return sim(self, sensor['config'])
+    
+    def _simulation_params(self, sensor_type: str, config: Dict[str, Any]) -> Tuple[int, float, float, float]:
+        """
+        Get the batch simulation parameters for a sensor
+        
+        Returns:
+            Tuple of (kind, base value, variation, failure rate)
+        """
+        if sensor_type in self._ANALOG_RANGES:
+            base_value, variation = self._ANALOG_RANGES[sensor_type]
+            return _KIND_ANALOG, base_value, variation, 0.0
+        if sensor_type == 'weight':
+            return _KIND_ANALOG, 0.0, float(config.get('capacity', 1000)), 0.0
+        if sensor_type in self._FAILURE_RATES:
+            return _KIND_BOOL, 0.0, 0.0, self._FAILURE_RATES[sensor_type]
+        return _KIND_ANALOG, 0.0, 0.0, 0.0
+    
+    def _next_uniform(self) -> float:
+        """Take the next uniform sample in [0, 1) from the lookup table"""
+        with self._sample_lock:
+            pos = self._lut_pos
+            if pos >= len(self._lut):
+                self._refill_lut()
+                pos = 0
+            self._lut_pos = pos + 1
+            return self._lut[pos]
+    
+    def _refill_lut(self) -> None:
+        """Draw a fresh table of uniform samples in a single call (under _sample_lock)"""
+        if np is not None:
+            self._lut = array('f', self._rng.random(_LUT_SIZE, dtype=np.float32).tobytes())
+        else:
+            self._lut = array('f', [self._rng.random() for _ in range(_LUT_SIZE)])
+    
+    # Simulated (base value, variation) of analogue sensors
+    _ANALOG_RANGES = {
+        # Normal range for elevator machinery temperature in Celsius
+        'temperature': (35.0, 15.0),
+        # Hydraulic pressure in PSI for hydraulic elevators
+        'pressure': (500.0, 200.0),
+        # Vibration in mm/s
+        'vibration': (2.0, 3.0),
+        # Speed in m/s
+        'speed': (1.5, 0.5)
+    }
+    
+    # Chance that a simulated pass/fail sensor reports a problem
+    _FAILURE_RATES = {
+        'door_sensor': 0.1,  # 90% chance doors are fine
+        'emergency_button': 0.05  # 95% chance button is working
+    }
+    
     def _simulate_temperature_reading(self, config: Dict[str, Any]) -> float:
         """Simulate a temperature sensor reading"""
-        # Normal range for elevator machinery temperature in Celsius
-        base_value = 35.0
-        variation = 15.0
-        return base_value + (random.random() * variation)
+        base_value, variation = self._ANALOG_RANGES['temperature']
+        return base_value + (self._next_uniform() * variation)
     
     def _simulate_pressure_reading(self, config: Dict[str, Any]) -> float:
         """Simulate a pressure sensor reading"""
-        # Hydraulic pressure in PSI for hydraulic elevators
-        base_value = 500.0
-        variation = 200.0
-        return base_value + (random.random() * variation)
+        base_value, variation = self._ANALOG_RANGES['pressure']
+        return base_value + (self._next_uniform() * variation)
     
     def _simulate_vibration_reading(self, config: Dict[str, Any]) -> float:
         """Simulate a vibration sensor reading"""
-        # Vibration in mm/s
-        base_value = 2.0
-        variation = 3.0
-        return base_value + (random.random() * variation)
+        base_value, variation = self._ANALOG_RANGES['vibration']
+        return base_value + (self._next_uniform() * variation)
     
     def _simulate_speed_reading(self, config: Dict[str, Any]) -> float:
         """Simulate an elevator speed reading"""
-        # Speed in m/s
-        base_value = 1.5
-        variation = 0.5
-        return base_value + (random.random() * variation)
+        base_value, variation = self._ANALOG_RANGES['speed']
+        return base_value + (self._next_uniform() * variation)
     
     def _simulate_weight_reading(self, config: Dict[str, Any]) -> float:
         """Simulate a weight sensor reading"""
         # Weight in kg
         capacity = config.get('capacity', 1000)
-        return random.random() * capacity
+        return self._next_uniform() * capacity
     
     def _simulate_door_sensor_reading(self, config: Dict[str, Any]) -> bool:
         """Simulate a door sensor reading"""
         # True = door closed properly, False = door issue
-        return random.random() > 0.1  # 90% chance doors are fine
+        return self._next_uniform() > self._FAILURE_RATES['door_sensor']
     
     def _simulate_emergency_button_reading(self, config: Dict[str, Any]) -> bool:
         """Simulate an emergency button check"""
         # True = button working, False = button malfunction
-        return random.random() > 0.05  # 95% chance button is working
+        return self._next_uniform() > self._FAILURE_RATES['emergency_button']
+    
+    # Simulation function for each sensor type, resolved once per sensor
+    # in connect_sensors
+    _SIMULATORS = {
+        'temperature': _simulate_temperature_reading,
+        'pressure': _simulate_pressure_reading,
+        'vibration': _simulate_vibration_reading,
+        'speed': _simulate_speed_reading,
+        'weight': _simulate_weight_reading,
+        'door_sensor': _simulate_door_sensor_reading,
+        'emergency_button': _simulate_emergency_button_reading
+    }
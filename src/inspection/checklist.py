@@ -3,11 +3,135 @@ Safety checklist module for elevator inspection
 """
 
 import logging
+import math
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; thresholds are then evaluated one by one
+    np = None
 
 logger = logging.getLogger('elevator_safety')
 
+# Sensor thresholds as (min_critical, max_critical, min_warning, max_warning)
+Thresholds = Tuple[float, float, float, float]
+
+# Maximum number of checks run at once by run_inspection
+_MAX_WORKERS = 8
+
+# Check statuses, shared by every result so they compare by identity
+STATUS_PASS = sys.intern('pass')
+STATUS_WARNING = sys.intern('warning')
+STATUS_FAIL = sys.intern('fail')
+STATUS_ERROR = sys.intern('error')
+STATUS_SKIPPED = sys.intern('skipped')
+
+# Sensor check statuses indexed by evaluation code, which is computed as
+# warning flag + 2 * critical flag (codes 2 and 3 are both a failure)
+_STATUS_NAMES = (STATUS_PASS, STATUS_WARNING, STATUS_FAIL, STATUS_FAIL)
+
+
+@dataclass
+class CheckResult:
+    """Result of a single checklist item"""
+    
+    __slots__ = ('item_id', 'name', 'type', 'value', 'status', 'timestamp',
+                 'category', 'criticality', 'error')
+    
+    item_id: str
+    name: str
+    type: str
+    value: Any
+    status: Optional[str]
+    timestamp: str
+    category: str
+    criticality: str
+    error: Optional[str]
+    
+    @classmethod
+    def from_dict(cls, result: Mapping[str, Any]) -> 'CheckResult':
+        """
+        Build a result from a plain result dictionary, e.g. an item
+        returned by InspectionDatabase.get_inspection
+        
+        Args:
+            result: Result dictionary; fields it lacks get their defaults
+            
+        Returns:
+            The check result
+        """
+        return cls(
+            item_id=result.get('item_id'),
+            name=result['name'],
+            type=result.get('type'),
+            value=result.get('value'),
+            status=result['status'],
+            timestamp=result.get('timestamp'),
+            category=result.get('category', 'general'),
+            criticality=result.get('criticality', 'normal'),
+            error=result.get('error')
+        )
+    
+    def __getitem__(self, key: str) -> Any:
+        """Read a field by name, as with plain result dictionaries"""
+        if key not in _CHECK_RESULT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a field by name, returning default for unknown names"""
+        return getattr(self, key) if key in _CHECK_RESULT_FIELDS else default
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to a dictionary, e.g. for serialization"""
+        return asdict(self)
+
+
+# Field names of CheckResult, for constant-time lookups by name
+_CHECK_RESULT_FIELDS = frozenset(CheckResult.__slots__)
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values; anything else from the configuration is kept as is"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Threshold names in compiled order, with the value used when one is not configured
+_THRESHOLD_DEFAULTS = (
+    ('min_critical', -math.inf),
+    ('max_critical', math.inf),
+    ('min_warning', -math.inf),
+    ('max_warning', math.inf)
+)
+
+
+def _compile_thresholds(thresholds: Dict[str, Any]) -> Thresholds:
+    """
+    Flatten a thresholds dictionary into a tuple, using infinities for
+    limits that are not configured
+    
+    Args:
+        thresholds: Dictionary containing threshold values
+    
+    Returns:
+        Tuple of (min_critical, max_critical, min_warning, max_warning)
+    
+    Raises:
+        ValueError: If a configured limit is not a number
+    """
+    limits = []
+    for name, default in _THRESHOLD_DEFAULTS:
+        value = thresholds.get(name, default)
+        if (not isinstance(value, (int, float)) or isinstance(value, bool)
+                or math.isnan(value)):
+            raise ValueError(f"Invalid threshold {name}: {value!r}")
+        limits.append(value)
+    return tuple(limits)
+
 
 class SafetyChecklist:
     """Manages the safety inspection checklist for elevators"""
@@ -20,88 +144,245 @@ class SafetyChecklist:
             checklist_items: List of checklist item configurations
         """
         self.checklist_items = checklist_items
+        
+        # Precompute sensor thresholds so each check is a plain comparison.
+        # _slots holds, for each checklist position, the row of the item in
+        # the threshold arrays (None if it has no usable thresholds); it is
+        # kept here rather than on the item, which other checklists may share.
+        # Items with invalid thresholds are reported as errors when run.
+        self._thresholds: List[Thresholds] = []
+        self._slots: List[Optional[int]] = []
+        self._threshold_errors: Dict[int, str] = {}
+        for position, item in enumerate(checklist_items):
+            # Resolve defaults and the check handler once instead of per run
+            item['category'] = _intern(item.get('category', 'general'))
+            item['criticality'] = _intern(item.get('criticality', 'normal'))
+            item['_handler'] = self._HANDLERS.get(item.get('type'), SafetyChecklist._handle_unknown)
+            
+            slot = None
+            if item.get('type') == 'sensor' and 'thresholds' in item:
+                try:
+                    thresholds = _compile_thresholds(item['thresholds'])
+                except (AttributeError, ValueError) as e:
+                    logger.warning(f"Invalid thresholds for check {item.get('name')}: {e}")
+                    self._threshold_errors[position] = str(e)
+                else:
+                    slot = len(self._thresholds)
+                    self._thresholds.append(thresholds)
+            self._slots.append(slot)
+        
+        if np is not None:
+            columns = np.array(self._thresholds, dtype=float).reshape(-1, 4).T
+            self._mins_c, self._maxs_c, self._mins_w, self._maxs_w = columns
+        
         logger.debug(f"Initialized safety checklist with {len(checklist_items)} items")
     
-    def run_inspection(self, elevator_interface) -> List[Dict[str, Any]]:
+    def run_inspection(self, elevator_interface) -> List[CheckResult]:
         """
         Run through the complete safety checklist
         
+        Sensor readings are taken one after another in checklist order, so a
+        seeded simulation hands every sensor the same sample on each run.
+        Visual and unknown checks return at once and run inline as well.
+        Only mechanical tests wait on the hardware; when there are several,
+        they run concurrently. Results keep the order of the checklist.
+        
         Args:
             elevator_interface: Interface to the elevator hardware
             
         Returns:
             List of inspection results
         """
-        results = []
+        if not self.checklist_items:
+            return []
         
-        for item in self.checklist_items:
-            logger.info(f"Checking: {item['name']}")
-            
-            try:
-                # Get sensor data or manual input based on check type
-                if item['type'] == 'sensor':
-                    value = elevator_interface.get_sensor_reading(item['sensor_id'])
-                    status = self._evaluate_sensor_reading(value, item['thresholds'])
-                elif item['type'] == 'visual':
-                    # For visual inspections, we'd typically have a UI prompt
-                    # Here we're simulating with a default "pass" for demonstration
-                    value = "SIMULATED VISUAL INSPECTION"
-                    status = "pass"
-                elif item['type'] == 'mechanical':
-                    value = elevator_interface.test_mechanical_component(item['component_id'])
-                    status = "pass" if value else "fail"
+        # All checks in one pass are stamped with the inspection start time
+        timestamp = datetime.now().isoformat()
+        
+        def run_item(item: Dict[str, Any]) -> CheckResult:
+            return self._run_item(item, elevator_interface, timestamp)
+        
+        results: List[Optional[CheckResult]] = [None] * len(self.checklist_items)
+        blocking = []
+        for position, item in enumerate(self.checklist_items):
+            if item['_handler'] in self._BLOCKING_HANDLERS:
+                blocking.append(position)
+            else:
+                results[position] = run_item(item)
+        
+        if len(blocking) < 2:
+            # Starting a thread pool costs more than it saves on one test
+            for position in blocking:
+                results[position] = run_item(self.checklist_items[position])
+        else:
+            workers = min(_MAX_WORKERS, len(blocking))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                items = [self.checklist_items[position] for position in blocking]
+                for position, result in zip(blocking, executor.map(run_item, items)):
+                    results[position] = result
+        
+        # Sensor checks are left without a status for one batched evaluation
+        pending = []
+        for position, result in enumerate(results):
+            if result.status is None:
+                slot = self._slots[position]
+                if slot is None:
+                    error = self._threshold_errors.get(
+                        position, "No thresholds configured for sensor check")
+                    self._fail_check(result, error)
                 else:
-                    logger.warning(f"Unknown check type: {item['type']}")
-                    value = None
-                    status = "skipped"
-                
-                result = {
-                    "item_id": item['id'],
-                    "name": item['name'],
-                    "type": item['type'],
-                    "value": value,
-                    "status": status,
-                    "timestamp": datetime.now().isoformat(),
-                    "category": item.get('category', 'general'),
-                    "criticality": item.get('criticality', 'normal')
-                }
-                
-                results.append(result)
-                logger.debug(f"Check result: {item['name']} - {status}")
-                
-            except Exception as e:
-                logger.error(f"Error during check {item['name']}: {str(e)}")
-                results.append({
-                    "item_id": item['id'],
-                    "name": item['name'],
-                    "type": item['type'],
-                    "value": None,
-                    "status": "error",
-                    "timestamp": datetime.now().isoformat(),
-                    "category": item.get('category', 'general'),
-                    "criticality": item.get('criticality', 'normal'),
-                    "error": str(e)
-                })
+                    pending.append((position, slot, result.value))
+        if pending:
+            positions, slots, values = zip(*pending)
+            statuses = self._evaluate_sensor_readings(slots, values)
+            for position, status in zip(positions, statuses):
+                results[position].status = status
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                for position in positions:
+                    logger.debug("Check result: %s - %s",
+                                 results[position].name, results[position].status)
         
         return results
     
-    def _evaluate_sensor_reading(self, value: float, thresholds: Dict[str, Any]) -> str:
+    def _run_item(self, item: Dict[str, Any], elevator_interface, timestamp: str) -> CheckResult:
+        """
+        Run a single checklist item
+        
+        Args:
+            item: Checklist item configuration
+            elevator_interface: Interface to the elevator hardware
+            timestamp: Timestamp recorded for the check
+            
+        Returns:
+            Inspection result; sensor checks have a status of None until
+            their reading is evaluated against the thresholds
+        """
+        logger.info("Checking: %s", item['name'])
+        
+        try:
+            # Get sensor data or manual input based on check type
+            value, status = item['_handler'](self, item, elevator_interface)
+            
+            if status is not None:
+                logger.debug("Check result: %s - %s", item['name'], status)
+            
+            return CheckResult(
+                item_id=item['id'],
+                name=item['name'],
+                type=item['type'],
+                value=value,
+                status=status,
+                timestamp=timestamp,
+                category=item['category'],
+                criticality=item['criticality'],
+                error=None
+            )
+            
+        except Exception as e:
+            logger.error(f"Error during check {item['name']}: {str(e)}")
+            return CheckResult(
+                item_id=item['id'],
+                name=item['name'],
+                type=item['type'],
+                value=None,
+                status=STATUS_ERROR,
+                timestamp=timestamp,
+                category=item['category'],
+                criticality=item['criticality'],
+                error=str(e)
+            )
+    
+    def _fail_check(self, result: CheckResult, error: str) -> None:
+        """
+        Turn a sensor check that cannot be evaluated into an error result
+        
+        Args:
+            result: Result of the check, still without a status
+            error: Reason the check could not be evaluated
+        """
+        logger.error(f"Error during check {result.name}: {error}")
+        result.value = None
+        result.status = STATUS_ERROR
+        result.error = error
+    
+    def _evaluate_sensor_readings(self, slots: Sequence[int], values: Sequence[float]) -> List[str]:
+        """
+        Evaluate several sensor readings against their thresholds at once
+        
+        Args:
+            slots: Threshold slot of each sensor check
+            values: The sensor reading values
+            
+        Returns:
+            Status string for each reading: 'pass', 'warning', or 'fail'
+        """
+        if np is None:
+            return [self._evaluate_sensor_reading(value, self._thresholds[slot])
+                    for slot, value in zip(slots, values)]
+        
+        idx = np.array(slots, dtype=np.intp)
+        v = np.array(values, dtype=float)
+        mins_c, maxs_c = self._mins_c[idx], self._maxs_c[idx]
+        mins_w, maxs_w = self._mins_w[idx], self._maxs_w[idx]
+        
+        fail = (v < mins_c) | (v > maxs_c)
+        warn = (v < mins_w) | (v > maxs_w)
+        codes = warn.astype(np.int8) + 2 * fail.astype(np.int8)
+        
+        return [_STATUS_NAMES[code] for code in codes.tolist()]
+    
+    def _evaluate_sensor_reading(self, value: float,
+                                 thresholds: Union[Thresholds, Dict[str, Any]]) -> str:
         """
         Evaluate a sensor reading against defined thresholds
         
         Args:
             value: The sensor reading value
-            thresholds: Dictionary containing threshold values
+            thresholds: Compiled threshold tuple, or a dictionary containing
+                threshold values
             
         Returns:
             Status string: 'pass', 'warning', or 'fail'
         """
-        if 'min_critical' in thresholds and value < thresholds['min_critical']:
-            return 'fail'
-        if 'max_critical' in thresholds and value > thresholds['max_critical']:
-            return 'fail'
-        if 'min_warning' in thresholds and value < thresholds['min_warning']:
-            return 'warning'
-        if 'max_warning' in thresholds and value > thresholds['max_warning']:
-            return 'warning'
-        return 'pass'
+        if isinstance(thresholds, dict):
+            thresholds = _compile_thresholds(thresholds)
+        min_critical, max_critical, min_warning, max_warning = thresholds
+        
+        # Branchless: both range checks always run and index the status table
+        warning = (value < min_warning) | (value > max_warning)
+        critical = (value < min_critical) | (value > max_critical)
+        return _STATUS_NAMES[warning + 2 * critical]
+    
+    def _handle_sensor(self, item: Dict[str, Any], elevator_interface) -> Tuple[Any, Optional[str]]:
+        """Read a sensor check; its status is left to the batched threshold evaluation"""
+        value = elevator_interface.get_sensor_reading(item['sensor_id'])
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Non-numeric sensor reading: {value!r}")
+        return value, None
+    
+    def _handle_visual(self, item: Dict[str, Any], elevator_interface) -> Tuple[Any, Optional[str]]:
+        """Run a visual check"""
+        # For visual inspections, we'd typically have a UI prompt
+        # Here we're simulating with a default "pass" for demonstration
+        return "SIMULATED VISUAL INSPECTION", STATUS_PASS
+    
+    def _handle_mechanical(self, item: Dict[str, Any], elevator_interface) -> Tuple[Any, Optional[str]]:
+        """Run a mechanical component test"""
+        value = elevator_interface.test_mechanical_component(item['component_id'])
+        return value, STATUS_PASS if value else STATUS_FAIL
+    
+    def _handle_unknown(self, item: Dict[str, Any], elevator_interface) -> Tuple[Any, Optional[str]]:
+        """Skip a check of a type that is not supported"""
+        logger.warning(f"Unknown check type: {item['type']}")
+        return None, STATUS_SKIPPED
+    
+    # Handler for each check type, resolved once per item in __init__
+    _HANDLERS = {
+        'sensor': _handle_sensor,
+        'visual': _handle_visual,
+        'mechanical': _handle_mechanical
+    }
+    
+    # Handlers that wait on the hardware, run concurrently by run_inspection
+    _BLOCKING_HANDLERS = frozenset({_handle_mechanical})
@@ -3,10 +3,18 @@ Safety analyzer for elevator inspection results
 """
 
 import logging
-from typing import Dict, List, Any
+from typing import Dict, Any, Mapping, Sequence, Union
+
+from src.inspection.checklist import (
+    CheckResult, STATUS_ERROR, STATUS_FAIL, STATUS_PASS, STATUS_WARNING
+)
 
 logger = logging.getLogger('elevator_safety')
 
+# An inspection result: a CheckResult, or a plain dictionary with the same
+# fields such as the items returned by InspectionDatabase.get_inspection
+Result = Union[CheckResult, Mapping[str, Any]]
+
 
 class SafetyAnalyzer:
     """Analyzes inspection results to determine safety status"""
@@ -21,52 +29,53 @@ class SafetyAnalyzer:
         self.safety_thresholds = safety_thresholds
         logger.debug(f"Initialized safety analyzer with thresholds: {safety_thresholds}")
     
-    def analyze(self, inspection_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze(self, inspection_results: Sequence[Result]) -> Dict[str, Any]:
         """
         Analyze inspection results and determine safety status
         
         Args:
-            inspection_results: List of inspection result dictionaries
+            inspection_results: List of inspection results, as CheckResult
+                objects or plain dictionaries
             
         Returns:
             Dictionary containing analysis results
         """
+        # Group results by status in a single pass; other statuses
+        # (e.g. 'skipped') are not counted
+        buckets = {STATUS_FAIL: [], STATUS_WARNING: [], STATUS_PASS: [], STATUS_ERROR: []}
+        for result in inspection_results:
+            if isinstance(result, CheckResult):
+                bucket = buckets.get(result.status)
+            else:
+                status = result['status']
+                bucket = buckets.get(status)
+                # Plain dictionaries are converted once, and only if the
+                # analysis reports their fields; passed checks are just counted
+                if bucket is not None and status != STATUS_PASS:
+                    result = CheckResult.from_dict(result)
+            if bucket is not None:
+                bucket.append(result)
+        
         # Count different types of results
-        critical_issues = 0
-        warnings = 0
-        passed = 0
-        errors = 0
+        critical_issues = len(buckets[STATUS_FAIL])
+        warnings = len(buckets[STATUS_WARNING])
+        passed = len(buckets[STATUS_PASS])
+        errors = len(buckets[STATUS_ERROR])
         
         # Lists to store specific issues
-        critical_items = []
-        warning_items = []
-        error_items = []
-        
-        # Analyze each result
-        for result in inspection_results:
-            if result['status'] == 'fail':
-                critical_issues += 1
-                critical_items.append({
-                    'name': result['name'],
-                    'value': result['value'],
-                    'category': result.get('category', 'general')
-                })
-            elif result['status'] == 'warning':
-                warnings += 1
-                warning_items.append({
-                    'name': result['name'],
-                    'value': result['value'],
-                    'category': result.get('category', 'general')
-                })
-            elif result['status'] == 'pass':
-                passed += 1
-            elif result['status'] == 'error':
-                errors += 1
-                error_items.append({
-                    'name': result['name'],
-                    'error': result.get('error', 'Unknown error'),
-                    'category': result.get('category', 'general')
-                })
+        critical_items = [
+            {'name': r.name, 'value': r.value, 'category': r.category}
+            for r in buckets[STATUS_FAIL]
+        ]
+        warning_items = [
+            {'name': r.name, 'value': r.value, 'category': r.category}
+            for r in buckets[STATUS_WARNING]
+        ]
+        error_items = [
+            {'name': r.name, 'error': r.error if r.error is not None else 'Unknown error',
+             'category': r.category}
+            for r in buckets[STATUS_ERROR]
+        ]
         
         # Determine overall safety status
         if critical_issues > 0:
@@ -3,17 +3,30 @@ Configuration utilities for elevator safety inspection system
 """
 
 import os
+import copy
 import yaml
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# Prefer the libyaml-backed loader, falling back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 logger = logging.getLogger('elevator_safety')
 
+# Parsed configurations by absolute path, with the (mtime, size) they were read at
+_cfg_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from YAML file
     
+    Files are only parsed again once their modification time or size
+    changes; each call returns its own copy of the configuration.
+    
     Args:
         config_path: Path to configuration file
         
@@ -29,9 +42,21 @@ def load_config(config_path: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        path = os.path.abspath(config_path)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        
+        cached = _cfg_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            logger.debug(f"Using cached configuration for {config_path}")
+            return copy.deepcopy(cached[1])
+        
+        # Hand raw bytes to the parser, which detects the encoding itself
+        with open(path, 'rb') as f:
+            config = yaml.load(f.read(), Loader=_Loader)
         
+        # Cache a private copy so callers may modify what they are given
+        _cfg_cache[path] = (stamp, copy.deepcopy(config))
         logger.debug(f"Loaded configuration from {config_path}")
         return config
     except yaml.YAMLError as e:
@@ -4,13 +4,179 @@ Database utilities for storing inspection results
 
 import os
 import json
+import re
 import sqlite3
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
+
+# Serialize item values with orjson when installed; it is several times faster
+# than json. Values orjson rejects (non-str dict keys, integers wider than 64
+# bits) and the NaN/Infinity tokens json writes go through json instead.
+# orjson reads integers wider than 64 bits as floats, so text with a run of
+# that many digits is read with json as well.
+try:
+    import orjson
+    
+    _LONG_DIGITS = re.compile(r'[0-9]{19}')
+    
+    def _dumps(value: Any) -> str:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            return json.dumps(value)
+    
+    def _loads(text: str) -> Any:
+        if _LONG_DIGITS.search(text) is None:
+            try:
+                return orjson.loads(text)
+            except ValueError:
+                pass
+        return json.loads(text)
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
 
 logger = logging.getLogger('elevator_safety')
 
+# Version of the schema created by _initialize_schema, kept in PRAGMA user_version
+_SCHEMA_VERSION = 1
+
+# Integer codes for the fixed vocabularies, which are stored as small
+# integers instead of repeating the text in every row. Values outside a
+# vocabulary are stored as text; the code columns have no declared type,
+# so SQLite keeps such text as it is even when it looks like a number.
+_STATUS_ENC = {'pass': 0, 'warning': 1, 'fail': 2, 'error': 3, 'skipped': 4}
+_CRITICALITY_ENC = {'normal': 0, 'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+_CATEGORY_ENC = {'general': 0, 'mechanical': 1, 'electrical': 2, 'operational': 3, 'safety': 4}
+_SAFETY_LEVEL_ENC = {'safe': 0, 'warning': 1, 'incomplete': 2, 'critical': 3}
+
+_STATUS_DEC = {code: name for name, code in _STATUS_ENC.items()}
+_CRITICALITY_DEC = {code: name for name, code in _CRITICALITY_ENC.items()}
+_CATEGORY_DEC = {code: name for name, code in _CATEGORY_ENC.items()}
+_SAFETY_LEVEL_DEC = {code: name for name, code in _SAFETY_LEVEL_ENC.items()}
+
+
+def _encode(codes: Dict[str, int], value: Any) -> Any:
+    """Code of a vocabulary value; values outside the vocabulary are kept as text"""
+    code = codes.get(value)
+    if code is not None:
+        return code
+    return None if value is None else str(value)
+
+
+def _encode_sql(column: str, codes: Dict[str, int]) -> str:
+    """SQL expression mapping a text column to its integer code, for migrations"""
+    cases = ' '.join(f"WHEN '{name}' THEN {code}" for name, code in codes.items())
+    return f"CASE {column} {cases} ELSE {column} END"
+
+
+# Largest integer magnitude stored in value_num; every integer up to it is
+# also exact as a double, so it survives any numeric handling on the way
+_MAX_NATIVE_INT = 2 ** 53
+
+
+def _split_value(value: Any) -> Tuple[Optional[str], Union[int, float, None]]:
+    """
+    Split an item value into its value and value_num columns: plain numbers
+    such as sensor readings are stored natively, anything else as JSON text
+    
+    value_num has no declared type, so integers and floats keep their type.
+    Booleans are kept as JSON so they are read back as booleans, and so are
+    integers too large for value_num. NaN is written as json's NaN token:
+    SQLite would store it as NULL, and orjson would write it as null.
+    """
+    if value is None:
+        return None, None
+    if isinstance(value, float):
+        if value != value:
+            return json.dumps(value), None
+        return None, value
+    if isinstance(value, int) and not isinstance(value, bool) and abs(value) <= _MAX_NATIVE_INT:
+        return None, value
+    return _dumps(value), None
+
+
+# Current table definitions; the code columns are untyped, see _encode
+_SQL_CREATE_INSPECTIONS = '''
+    CREATE TABLE IF NOT EXISTS inspections (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        elevator_id TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
+        inspector TEXT,
+        safety_level NOT NULL,
+        critical_issues INTEGER NOT NULL,
+        warnings INTEGER NOT NULL,
+        passed INTEGER NOT NULL,
+        compliance_percentage REAL NOT NULL,
+        report_path TEXT,
+        notes TEXT
+    )
+'''
+
+_SQL_CREATE_ITEMS = '''
+    CREATE TABLE IF NOT EXISTS inspection_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        inspection_id INTEGER NOT NULL,
+        item_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        category NOT NULL,
+        criticality NOT NULL,
+        status NOT NULL,
+        value TEXT,
+        value_num,
+        FOREIGN KEY (inspection_id) REFERENCES inspections (id)
+    )
+'''
+
+# Insert statements are kept as constants so the connection's statement
+# cache hands back the same prepared statement on every save
+_SQL_INSERT_INSPECTION = '''
+    INSERT INTO inspections (
+        elevator_id, timestamp, inspector, safety_level,
+        critical_issues, warnings, passed, compliance_percentage,
+        report_path, notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_ITEM = '''
+    INSERT INTO inspection_items (
+        inspection_id, item_id, name, category, criticality, status, value, value_num
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSPECTION_COLUMNS = (
+    'id', 'elevator_id', 'timestamp', 'inspector', 'safety_level', 'critical_issues',
+    'warnings', 'passed', 'compliance_percentage', 'report_path', 'notes'
+)
+
+_ITEM_COLUMNS = (
+    'id', 'inspection_id', 'item_id', 'name', 'category', 'criticality', 'status', 'value',
+    'value_num'
+)
+
+# An inspection and its items in one query; each row carries the inspection
+# columns followed by the item columns, which are NULL if it has no items
+_SQL_SELECT_INSPECTION = f'''
+    SELECT {', '.join('i.' + column for column in _INSPECTION_COLUMNS)},
+           {', '.join('it.' + column for column in _ITEM_COLUMNS)}
+    FROM inspections i
+    LEFT JOIN inspection_items it ON it.inspection_id = i.id
+    WHERE i.id = ?
+    ORDER BY it.id
+'''
+
+_SQL_SELECT_HISTORY = f'''
+    SELECT {', '.join(_INSPECTION_COLUMNS)}
+    FROM inspections
+    WHERE elevator_id = ?
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+'''
+
 
 class InspectionDatabase:
     """Database for storing and retrieving elevator inspection data"""
@@ -28,76 +194,193 @@ class InspectionDatabase:
             db_dir = os.path.join(home_dir, ".elevator_safety")
             
             # Create directory if it doesn't exist
-            if not os.path.exists(db_dir):
-                os.makedirs(db_dir)
+            os.makedirs(db_dir, exist_ok=True)
                 
             db_path = os.path.join(db_dir, "inspections.db")
         
         self.db_path = db_path
-        self.conn = None
         
-        logger.debug(f"Database initialized with path: {db_path}")
+        # One connection per thread, keyed by thread ident, so a thread only
+        # ever reads committed data and never another thread's open
+        # transaction. Writes also hold this lock, so writers in this process
+        # queue here rather than on SQLite's busy timeout.
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        self._lock = threading.RLock()
+        
+        logger.debug("Database initialized with path: %s", db_path)
         
         # Initialize database schema if needed
         self._initialize_schema()
     
     def _initialize_schema(self) -> None:
-        """Create database schema if it doesn't exist"""
+        """Create database schema if it doesn't exist, migrating older schemas"""
         try:
             conn = self._get_connection()
-            cursor = conn.cursor()
             
-            # Create inspections table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS inspections (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    elevator_id TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    inspector TEXT,
-                    safety_level TEXT NOT NULL,
-                    critical_issues INTEGER NOT NULL,
-                    warnings INTEGER NOT NULL,
-                    passed INTEGER NOT NULL,
-                    compliance_percentage REAL NOT NULL,
-                    report_path TEXT,
-                    notes TEXT
-                )
-            ''')
-            
-            # Create inspection_items table for detailed results
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS inspection_items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    inspection_id INTEGER NOT NULL,
-                    item_id TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    criticality TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    value TEXT,
-                    FOREIGN KEY (inspection_id) REFERENCES inspections (id)
-                )
-            ''')
-            
-            conn.commit()
+            # Existing databases at the current version skip the DDL entirely
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                logger.debug("Database schema is up to date")
+                return
+            
+            with self._transaction() as cursor:
+                # Read again under the write lock; another process may
+                # have initialized the database in the meantime
+                version = cursor.execute("PRAGMA user_version").fetchone()[0]
+                if version < _SCHEMA_VERSION and self._has_table(cursor, 'inspections'):
+                    self._migrate_baseline(cursor)
+                
+                self._create_tables(cursor)
+                cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            
             logger.debug("Database schema initialized")
             
         except Exception as e:
-            logger.error(f"Error initializing database schema: {str(e)}")
+            logger.error("Error initializing database schema: %s", e)
             raise
     
+    def _create_tables(self, cursor: sqlite3.Cursor) -> None:
+        """Create the tables and indexes of the current schema if they don't exist"""
+        # Create inspections table
+        cursor.execute(_SQL_CREATE_INSPECTIONS)
+        
+        # Create inspection_items table for detailed results
+        cursor.execute(_SQL_CREATE_ITEMS)
+        
+        self._create_indexes(cursor)
+    
+    def _create_indexes(self, cursor: sqlite3.Cursor) -> None:
+        """Create the indexes of the current schema if they don't exist"""
+        # Index the history lookup (newest first per elevator) and the
+        # item lookup by inspection so neither needs a full table scan
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_inspections_elev_ts
+            ON inspections (elevator_id, timestamp DESC, id DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_items_inspection
+            ON inspection_items (inspection_id)
+        ''')
+    
+    def _has_table(self, cursor: sqlite3.Cursor, name: str) -> bool:
+        """Check whether a table exists in the database"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,))
+        return cursor.fetchone() is not None
+    
+    def _migrate_baseline(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Migrate the unversioned schema of the first release by rebuilding
+        both tables in the current layout
+        
+        The enumerated columns become integer codes (text outside a
+        vocabulary is copied unchanged), and timestamps, stored as local
+        ISO 8601 text, become Unix time. Item values stay JSON text, which
+        is still read.
+        """
+        logger.info("Migrating inspection database to the current schema")
+        
+        cursor.execute("ALTER TABLE inspection_items RENAME TO _inspection_items_v0")
+        cursor.execute("ALTER TABLE inspections RENAME TO _inspections_v0")
+        self._create_tables(cursor)
+        
+        # The 'utc' modifier reads the stored text as local time; text that
+        # does not parse is kept as it is
+        cursor.execute(f'''
+            INSERT INTO inspections
+            SELECT id, elevator_id,
+                   COALESCE(CAST(strftime('%s', timestamp, 'utc') AS INTEGER), timestamp),
+                   inspector,
+                   {_encode_sql('safety_level', _SAFETY_LEVEL_ENC)},
+                   critical_issues, warnings, passed, compliance_percentage,
+                   report_path, notes
+            FROM _inspections_v0
+        ''')
+        cursor.execute(f'''
+            INSERT INTO inspection_items
+            SELECT id, inspection_id, item_id, name,
+                   {_encode_sql('category', _CATEGORY_ENC)},
+                   {_encode_sql('criticality', _CRITICALITY_ENC)},
+                   {_encode_sql('status', _STATUS_ENC)},
+                   value, NULL
+            FROM _inspection_items_v0
+        ''')
+        
+        # Dropping the old tables also drops their indexes
+        cursor.execute("DROP TABLE _inspection_items_v0")
+        cursor.execute("DROP TABLE _inspections_v0")
+    
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """The calling thread's database connection, if it has one open"""
+        return self._connections.get(threading.get_ident())
+    
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection, creating one if needed"""
-        if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-        return self.conn
+        """Get the calling thread's database connection, creating one if needed"""
+        conn = self.conn
+        if conn is None:
+            # Autocommit mode: transactions are opened explicitly where they
+            # are needed instead of by the module's implicit BEGIN heuristics.
+            # No type converters are used, and the statement cache is sized
+            # well above the number of distinct SQL strings in this module.
+            # The connection is only used by this thread; close() may run on
+            # another thread, hence check_same_thread=False.
+            conn = sqlite3.connect(self.db_path, detect_types=0,
+                                   cached_statements=256, isolation_level=None,
+                                   check_same_thread=False)
+            
+            # Per-connection settings, applied again whenever we reconnect:
+            # WAL lets readers run alongside a writer, and with NORMAL sync
+            # commits no longer wait on a full fsync
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-8000")
+            
+            with self._connections_lock:
+                self._connections[threading.get_ident()] = conn
+        return conn
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run a block of writes as one transaction, taking SQLite's write lock
+        up front; the connection commits on success and rolls back if the
+        block raises
+        
+        Inside a transaction this thread already has open, e.g. a save in a
+        bulk_mode block, the writes join it under a savepoint instead, so a
+        failing block undoes only its own writes.
+        
+        Yields:
+            Cursor for the writes, inside the open transaction
+        """
+        conn = self._get_connection()
+        
+        with self._lock:
+            if conn.in_transaction:
+                conn.execute("SAVEPOINT nested")
+                try:
+                    yield conn.cursor()
+                except BaseException:
+                    conn.execute("ROLLBACK TO nested")
+                    raise
+                finally:
+                    conn.execute("RELEASE nested")
+            else:
+                conn.execute("BEGIN IMMEDIATE")
+                with conn:
+                    yield conn.cursor()
     
     def close(self) -> None:
-        """Close the database connection"""
-        if self.conn is not None:
-            self.conn.close()
-            self.conn = None
+        """Close the database connections of all threads"""
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        
+        for conn in connections:
+            conn.close()
+        if connections:
             logger.debug("Database connection closed")
     
     def save_inspection(self, elevator_id: str, inspection_results: List[Dict[str, Any]], 
@@ -118,56 +401,111 @@ class InspectionDatabase:
             ID of the saved inspection record
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            # Save the inspection and its items in a single transaction
+            with self._transaction() as cursor:
+                # Insert main inspection record
+                cursor.execute(_SQL_INSERT_INSPECTION, self._inspection_row(
+                    elevator_id, int(time.time()), inspector, analysis,
+                    report_path, notes))
+                
+                inspection_id = cursor.lastrowid
+                
+                # Insert detailed inspection items in one batch
+                cursor.executemany(_SQL_INSERT_ITEM, self._item_rows(inspection_id, inspection_results))
             
-            # Insert main inspection record
-            cursor.execute('''
-                INSERT INTO inspections (
-                    elevator_id, timestamp, inspector, safety_level,
-                    critical_issues, warnings, passed, compliance_percentage,
-                    report_path, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                elevator_id,
-                datetime.now().isoformat(),
-                inspector or "System",
-                analysis['safety_level'],
-                analysis['critical_issues'],
-                analysis['warnings'],
-                analysis['passed'],
-                analysis['compliance_percentage'],
-                report_path,
-                notes
-            ))
-            
-            inspection_id = cursor.lastrowid
-            
-            # Insert detailed inspection items
-            for result in inspection_results:
-                cursor.execute('''
-                    INSERT INTO inspection_items (
-                        inspection_id, item_id, name, category, criticality, status, value
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    inspection_id,
-                    result['item_id'],
-                    result['name'],
-                    result.get('category', 'general'),
-                    result.get('criticality', 'normal'),
-                    result['status'],
-                    json.dumps(result['value']) if result['value'] is not None else None
-                ))
-            
-            conn.commit()
-            logger.info(f"Saved inspection {inspection_id} for elevator {elevator_id}")
+            logger.info("Saved inspection %s for elevator %s", inspection_id, elevator_id)
             
             return inspection_id
             
         except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"Error saving inspection to database: {str(e)}")
+            logger.error("Error saving inspection to database: %s", e)
+            raise
+    
+    def _inspection_row(self, elevator_id: str, timestamp: int, inspector: Optional[str],
+                        analysis: Dict[str, Any], report_path: Optional[str],
+                        notes: Optional[str]) -> tuple:
+        """Build the parameters of _SQL_INSERT_INSPECTION for one inspection"""
+        return (
+            elevator_id,
+            timestamp,
+            inspector or "System",
+            _encode(_SAFETY_LEVEL_ENC, analysis['safety_level']),
+            analysis['critical_issues'],
+            analysis['warnings'],
+            analysis['passed'],
+            analysis['compliance_percentage'],
+            report_path,
+            notes
+        )
+    
+    def _item_rows(self, inspection_id: int, inspection_results: Iterable[Dict[str, Any]]) -> List[tuple]:
+        """Build the parameters of _SQL_INSERT_ITEM for each item of an inspection"""
+        return [
+            (
+                inspection_id,
+                result['item_id'],
+                result['name'],
+                _encode(_CATEGORY_ENC, result.get('category', 'general')),
+                _encode(_CRITICALITY_ENC, result.get('criticality', 'normal')),
+                _encode(_STATUS_ENC, result['status']),
+                *_split_value(result['value'])
+            )
+            for result in inspection_results
+        ]
+    
+    @contextmanager
+    def bulk_mode(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run bulk writes in a single transaction with the indexes dropped;
+        they are rebuilt once at the end instead of being updated per row
+        
+        If the block raises, the transaction is rolled back, which also
+        restores the indexes.
+        
+        Yields:
+            Cursor for the writes, inside the open transaction
+        """
+        with self._transaction() as cursor:
+            cursor.execute("DROP INDEX IF EXISTS idx_inspections_elev_ts")
+            cursor.execute("DROP INDEX IF EXISTS idx_items_inspection")
+            
+            yield cursor
+            
+            self._create_indexes(cursor)
+    
+    def bulk_import(self, inspections: Iterable[Dict[str, Any]]) -> int:
+        """
+        Import inspection records in bulk, e.g. legacy inspection history
+        
+        Records use the layout returned by get_inspection, with their item
+        results under 'items'; their IDs are not kept.
+        
+        Args:
+            inspections: Inspection records to import
+            
+        Returns:
+            Number of inspections imported
+        """
+        try:
+            count = 0
+            with self.bulk_mode() as cursor:
+                item_rows = []
+                for record in inspections:
+                    cursor.execute(_SQL_INSERT_INSPECTION, self._inspection_row(
+                        record['elevator_id'], self._encode_timestamp(record['timestamp']),
+                        record.get('inspector'),
+                        record, record.get('report_path'), record.get('notes')))
+                    item_rows.extend(self._item_rows(cursor.lastrowid, record.get('items', [])))
+                    count += 1
+                
+                cursor.executemany(_SQL_INSERT_ITEM, item_rows)
+            
+            logger.info("Imported %s inspections", count)
+            
+            return count
+            
+        except Exception as e:
+            logger.error("Error importing inspections: %s", e)
             raise
     
     def get_inspection(self, inspection_id: int) -> Dict[str, Any]:
@@ -184,26 +522,31 @@ class InspectionDatabase:
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            # Get main inspection record
-            cursor.execute('''
-                SELECT * FROM inspections WHERE id = ?
-            ''', (inspection_id,))
-            
-            inspection = dict(cursor.fetchone())
+            cursor.execute(_SQL_SELECT_INSPECTION, (inspection_id,))
+            rows = cursor.fetchall()
+            if not rows:
+                raise ValueError(f"Inspection {inspection_id} not found")
             
-            # Get inspection items
-            cursor.execute('''
-                SELECT * FROM inspection_items WHERE inspection_id = ?
-            ''', (inspection_id,))
+            split = len(_INSPECTION_COLUMNS)
+            inspection = dict(zip(_INSPECTION_COLUMNS, rows[0][:split]))
+            self._decode_inspection(inspection)
             
             items = []
-            for row in cursor.fetchall():
-                item = dict(row)
-                # Parse JSON value
-                if item['value']:
+            for row in rows:
+                if row[split] is None:
+                    continue  # Inspection without items
+                item = dict(zip(_ITEM_COLUMNS, row[split:]))
+                item['category'] = _CATEGORY_DEC.get(item['category'], item['category'])
+                item['criticality'] = _CRITICALITY_DEC.get(item['criticality'], item['criticality'])
+                item['status'] = _STATUS_DEC.get(item['status'], item['status'])
+                # Numbers come from value_num, anything else is JSON text
+                value_num = item.pop('value_num')
+                if value_num is not None:
+                    item['value'] = value_num
+                elif item['value']:
                     try:
-                        item['value'] = json.loads(item['value'])
-                    except:
+                        item['value'] = _loads(item['value'])
+                    except ValueError:
                         pass
                 items.append(item)
             
@@ -212,33 +555,64 @@ class InspectionDatabase:
             return inspection
             
         except Exception as e:
-            logger.error(f"Error retrieving inspection {inspection_id}: {str(e)}")
+            logger.error("Error retrieving inspection %s: %s", inspection_id, e)
             raise
     
-    def get_elevator_history(self, elevator_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_elevator_history(self, elevator_id: str, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
         """
         Get inspection history for a specific elevator
         
         Args:
             elevator_id: Identifier for the elevator
-            limit: Maximum number of records to return
+            limit: Maximum number of records to return, or None for all
             
         Returns:
-            List of inspection records for the elevator
+            List of inspection records for the elevator, newest first
+        """
+        return list(self.iter_elevator_history(elevator_id, limit))
+    
+    def iter_elevator_history(self, elevator_id: str,
+                              limit: Optional[int] = 10) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the inspection history for a specific elevator
+        
+        Records are read from the database as they are consumed, so large
+        histories, e.g. for export, are never held in memory at once.
+        
+        Args:
+            elevator_id: Identifier for the elevator
+            limit: Maximum number of records to return, or None for all
+            
+        Yields:
+            Inspection records for the elevator, newest first
         """
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT * FROM inspections 
-                WHERE elevator_id = ? 
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (elevator_id, limit))
+            # A negative LIMIT means no limit in SQLite
+            cursor.execute(_SQL_SELECT_HISTORY, (elevator_id, -1 if limit is None else limit))
             
-            return [dict(row) for row in cursor.fetchall()]
+            for row in cursor:
+                yield self._decode_inspection(dict(zip(_INSPECTION_COLUMNS, row)))
             
         except Exception as e:
-            logger.error(f"Error retrieving history for elevator {elevator_id}: {str(e)}")
+            logger.error("Error retrieving history for elevator %s: %s", elevator_id, e)
             raise
+    
+    def _encode_timestamp(self, timestamp: Union[int, float, str]) -> int:
+        """Convert a Unix time or local ISO 8601 timestamp to stored Unix seconds"""
+        if isinstance(timestamp, str):
+            return int(datetime.fromisoformat(timestamp).timestamp())
+        return int(timestamp)
+    
+    def _decode_inspection(self, inspection: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replace the stored codes of an inspection record with their names
+        and its Unix timestamp with local ISO 8601 text, as it is reported
+        """
+        if isinstance(inspection['timestamp'], int):
+            inspection['timestamp'] = datetime.fromtimestamp(inspection['timestamp']).isoformat()
+        inspection['safety_level'] = _SAFETY_LEVEL_DEC.get(inspection['safety_level'],
+                                                           inspection['safety_level'])
+        return inspection
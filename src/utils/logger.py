@@ -4,7 +4,7 @@ Logging configuration for elevator safety inspection system
 
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from datetime import datetime
 
 
@@ -18,21 +18,27 @@ def setup_logger(level=logging.INFO, log_file=None):
     """
     # Create logs directory if it doesn't exist
     log_dir = os.path.join(os.getcwd(), 'logs')
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     
     # Generate log filename if not provided
     if log_file is None:
         date_str = datetime.now().strftime("%Y%m%d")
         log_file = os.path.join(log_dir, f"elevator_safety_{date_str}.log")
     
+    # Skip the per-record thread and process lookups; the formatters below
+    # never show them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Configure root logger
     logger = logging.getLogger()
     logger.setLevel(level)
     
     # Remove existing handlers to avoid duplicates when reconfiguring
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    for handler in logger.handlers:
+        handler.flush()  # Write out any buffered records
+    logger.handlers.clear()
     
     # Create formatters
     file_formatter = logging.Formatter(
@@ -50,18 +56,24 @@ def setup_logger(level=logging.INFO, log_file=None):
     file_handler.setFormatter(file_formatter)
     file_handler.setLevel(level)
     
+    # Buffer file output and write it in batches of up to 1024 records;
+    # errors are written at once (with everything before them), and
+    # logging flushes the buffer at interpreter exit
+    buffered_handler = MemoryHandler(1024, flushLevel=logging.ERROR, target=file_handler)
+    buffered_handler.setLevel(level)
+    
     # Configure console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(console_formatter)
     console_handler.setLevel(level)
     
     # Add handlers to logger
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_handler)
     logger.addHandler(console_handler)
     
     # Create application-specific logger
     app_logger = logging.getLogger('elevator_safety')
-    app_logger.info(f"Logging initialized at level {logging.getLevelName(level)}")
-    app_logger.info(f"Log file: {log_file}")
+    app_logger.info("Logging initialized at level %s", logging.getLevelName(level))
+    app_logger.info("Log file: %s", log_file)
     
     return app_logger
@@ -2,8 +2,11 @@
 Unit tests for the safety checklist module
 """
 
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
+from src.hardwareelevator.hardwaresensors import SensorManager
 from src.inspection.checklist import SafetyChecklist
 
 
@@ -55,6 +58,17 @@ class TestSafetyChecklist(unittest.TestCase):
         self.assertEqual(len(self.checklist.checklist_items), 3)
         self.assertEqual(self.checklist.checklist_items[0]['name'], "Test Sensor")
     
+    def test_initialization_non_string_fields(self):
+        """Test non-string categories and criticalities from YAML are accepted"""
+        checklist = SafetyChecklist([
+            {"id": "visual", "name": "Visual", "type": "visual", "category": None, "criticality": 1}
+        ])
+        
+        results = checklist.run_inspection(self.mock_elevator)
+        
+        self.assertIsNone(results[0]['category'])
+        self.assertEqual(results[0]['criticality'], 1)
+    
     def test_run_inspection(self):
         """Test running a complete inspection"""
         results = self.checklist.run_inspection(self.mock_elevator)
@@ -79,6 +93,34 @@ class TestSafetyChecklist(unittest.TestCase):
         self.mock_elevator.get_sensor_reading.assert_called_with('test_sensor_1')
         self.mock_elevator.test_mechanical_component.assert_called_with('test_component')
     
+    def test_thread_pool_only_for_several_blocking_checks(self):
+        """Test a thread pool is only started for two or more mechanical tests"""
+        with patch('src.inspection.checklist.ThreadPoolExecutor',
+                   wraps=ThreadPoolExecutor) as executor:
+            self.checklist.run_inspection(self.mock_elevator)
+            executor.assert_not_called()
+            
+            items = self.checklist_items + [dict(self.checklist_items[2], id="second")]
+            results = SafetyChecklist(items).run_inspection(self.mock_elevator)
+            executor.assert_called_once()
+        
+        self.assertEqual([r.item_id for r in results],
+                         ["test_sensor", "test_visual", "test_mechanical", "second"])
+        self.assertEqual([r.status for r in results], ['pass'] * 4)
+    
+    def test_check_result_fields(self):
+        """Test results expose their fields by attribute and by name"""
+        results = self.checklist.run_inspection(self.mock_elevator)
+        
+        visual_result = results[1]
+        self.assertEqual(visual_result.status, 'pass')
+        self.assertEqual(visual_result['category'], 'test')
+        self.assertIsNone(visual_result.get('error'))
+        self.assertIsNone(visual_result.get('unknown'))
+        self.assertEqual(visual_result.to_dict()['item_id'], 'test_visual')
+        with self.assertRaises(KeyError):
+            visual_result['unknown']
+    
     def test_evaluate_sensor_reading_pass(self):
         """Test sensor reading evaluation - pass case"""
         thresholds = {
@@ -119,6 +161,128 @@ class TestSafetyChecklist(unittest.TestCase):
         status = self.checklist._evaluate_sensor_reading(80, thresholds)
         self.assertEqual(status, 'fail')
     
+    def test_evaluate_sensor_reading_compiled(self):
+        """Test sensor reading evaluation against precompiled thresholds"""
+        thresholds = self.checklist._thresholds[0]
+        
+        self.assertEqual(self.checklist._evaluate_sensor_reading(30, thresholds), 'pass')
+        self.assertEqual(self.checklist._evaluate_sensor_reading(-100, thresholds), 'warning')
+        self.assertEqual(self.checklist._evaluate_sensor_reading(70.5, thresholds), 'fail')
+    
+    def test_evaluate_sensor_reading_min_critical(self):
+        """Test a reading below the critical minimum fails without warning limits"""
+        thresholds = {"min_critical": 0}
+        
+        self.assertEqual(self.checklist._evaluate_sensor_reading(-1, thresholds), 'fail')
+        self.assertEqual(self.checklist._evaluate_sensor_reading(1, thresholds), 'pass')
+    
+    def test_run_inspection_sensor_statuses(self):
+        """Test sensor checks are each evaluated against their own thresholds"""
+        items = [
+            {"id": f"sensor_{i}", "name": f"Sensor {i}", "type": "sensor",
+             "sensor_id": f"sensor_{i}", "thresholds": {"max_warning": 50, "max_critical": 70}}
+            for i in range(3)
+        ]
+        readings = {"sensor_0": 30.0, "sensor_1": 60.0, "sensor_2": 80.0}
+        self.mock_elevator.get_sensor_reading.side_effect = readings.get
+        
+        results = SafetyChecklist(items).run_inspection(self.mock_elevator)
+        
+        self.assertEqual([r['status'] for r in results], ['pass', 'warning', 'fail'])
+    
+    def test_batch_evaluation_matches_single(self):
+        """Test batched evaluation classifies readings like the single-reading path"""
+        items = [
+            {"id": f"sensor_{i}", "name": f"Sensor {i}", "type": "sensor",
+             "sensor_id": f"sensor_{i}", "thresholds": {"min_warning": 10, "max_warning": 50,
+                                                        "max_critical": 70}}
+            for i in range(3)
+        ]
+        checklist = SafetyChecklist(items)
+        slots = [0, 1, 2, 0, 1, 2]
+        values = [30.0, 5.0, 60.0, 80.0, float('inf'), 10.0]
+        
+        statuses = checklist._evaluate_sensor_readings(slots, values)
+        
+        self.assertEqual(statuses, ['pass', 'warning', 'warning', 'fail', 'fail', 'pass'])
+        self.assertEqual(statuses, [
+            checklist._evaluate_sensor_reading(value, checklist._thresholds[slot])
+            for slot, value in zip(slots, values)
+        ])
+    
+    def test_shared_items_keep_own_thresholds(self):
+        """Test a checklist item shared with another checklist keeps its thresholds"""
+        strict = {"id": "strict", "name": "Strict", "type": "sensor", "sensor_id": "s1",
+                  "thresholds": {"max_critical": 10}}
+        loose = {"id": "loose", "name": "Loose", "type": "sensor", "sensor_id": "s2",
+                 "thresholds": {"max_critical": 200}}
+        checklist = SafetyChecklist([strict, loose])
+        SafetyChecklist([loose])
+        self.mock_elevator.get_sensor_reading.return_value = 50.0
+        
+        results = checklist.run_inspection(self.mock_elevator)
+        
+        self.assertEqual([r.status for r in results], ['fail', 'pass'])
+    
+    def test_sensor_without_thresholds(self):
+        """Test a sensor check without thresholds is reported as an error"""
+        items = [{"id": "bare", "name": "Bare", "type": "sensor", "sensor_id": "s1"}]
+        
+        result = SafetyChecklist(items).run_inspection(self.mock_elevator)[0]
+        
+        self.assertEqual(result.status, 'error')
+        self.assertIsNone(result.value)
+        self.assertEqual(result.error, "No thresholds configured for sensor check")
+    
+    def test_invalid_thresholds(self):
+        """Test sensor checks with non-numeric thresholds are reported as errors"""
+        items = [
+            {"id": f"sensor_{i}", "name": f"Sensor {i}", "type": "sensor", "sensor_id": "s1",
+             "thresholds": {"max_warning": 50, "max_critical": limit}}
+            for i, limit in enumerate(["50", None, "abc", 70])
+        ]
+        
+        results = SafetyChecklist(items).run_inspection(self.mock_elevator)
+        
+        self.assertEqual([r.status for r in results], ['error', 'error', 'error', 'pass'])
+        self.assertEqual(results[0].error, "Invalid threshold max_critical: '50'")
+        self.assertIsNone(results[1].value)
+    
+    def test_seeded_inspections_repeat(self):
+        """Test two inspections with the same simulation seed get the same readings"""
+        sensors = {f"sensor_{i}": {"type": "temperature"} for i in range(64)}
+        items = [
+            {"id": sensor_id, "name": sensor_id, "type": "sensor", "sensor_id": sensor_id,
+             "thresholds": {"max_warning": 45, "max_critical": 48}}
+            for sensor_id in sensors
+        ]
+        items.append({"id": "visual", "name": "Visual", "type": "visual"})
+        
+        def run_seeded():
+            manager = SensorManager(sensors, seed=7)
+            manager.connect_sensors()
+            
+            def read_sensor(sensor_id):
+                # Uneven hardware latency, so concurrent reads would finish out of order
+                time.sleep(0.001 * (int(sensor_id.split('_')[1]) % 4))
+                return manager.get_reading(sensor_id)
+            
+            elevator = MagicMock()
+            elevator.get_sensor_reading.side_effect = read_sensor
+            results = SafetyChecklist([dict(item) for item in items]).run_inspection(elevator)
+            return [(r.item_id, r.value, r.status) for r in results]
+        
+        self.assertEqual(run_seeded(), run_seeded())
+    
+    def test_non_numeric_sensor_reading(self):
+        """Test a missing sensor reading is reported as an error"""
+        self.mock_elevator.get_sensor_reading.return_value = None
+        
+        results = self.checklist.run_inspection(self.mock_elevator)
+        
+        sensor_result = next(r for r in results if r['item_id'] == 'test_sensor')
+        self.assertEqual(sensor_result['status'], 'error')
+    
     def test_error_handling(self):
         """Test error handling during inspection"""
         # Make the sensor reading raise an exception
@@ -0,0 +1,84 @@
+"""
+Unit tests for the configuration utilities
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.utils import config
+from src.utils.config import load_config
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Tests for the load_config function"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, "config.yaml")
+        self.write_config("hardware:\n  sensors:\n    temp_motor:\n      type: temperature\n")
+        config._cfg_cache.clear()
+    
+    def tearDown(self):
+        """Clean up the temporary configuration"""
+        config._cfg_cache.clear()
+        shutil.rmtree(self.temp_dir)
+    
+    def write_config(self, text, mtime_ns=None):
+        """Write the test configuration file, optionally setting its mtime"""
+        with open(self.config_path, 'w') as f:
+            f.write(text)
+        if mtime_ns is not None:
+            os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+    
+    def test_load_config(self):
+        """Test a configuration file is parsed"""
+        loaded = load_config(self.config_path)
+        
+        self.assertEqual(loaded['hardware']['sensors']['temp_motor']['type'], "temperature")
+    
+    def test_missing_config(self):
+        """Test a missing configuration file is reported"""
+        with self.assertRaises(FileNotFoundError):
+            load_config(os.path.join(self.temp_dir, "missing.yaml"))
+    
+    def test_invalid_config(self):
+        """Test a malformed configuration file is reported"""
+        self.write_config("hardware: [unclosed\n")
+        
+        with self.assertRaises(ValueError):
+            load_config(self.config_path)
+    
+    def test_unchanged_file_is_not_parsed_again(self):
+        """Test an unchanged file is served from the cache"""
+        load_config(self.config_path)
+        
+        with patch.object(config.yaml, 'load') as yaml_load:
+            load_config(self.config_path)
+        
+        yaml_load.assert_not_called()
+    
+    def test_changed_mtime_invalidates_cache(self):
+        """Test a file rewritten with the same size is parsed again"""
+        self.write_config("value: 1\n", mtime_ns=1_000_000_000)
+        self.assertEqual(load_config(self.config_path), {"value": 1})
+        
+        self.write_config("value: 2\n", mtime_ns=2_000_000_000)
+        self.assertEqual(load_config(self.config_path), {"value": 2})
+    
+    def test_callers_get_independent_copies(self):
+        """Test changing a returned configuration does not affect later calls"""
+        first = load_config(self.config_path)
+        first['hardware']['sensors'].clear()
+        second = load_config(self.config_path)
+        second['hardware']['sensors']['temp_motor']['type'] = "pressure"
+        
+        third = load_config(self.config_path)
+        
+        self.assertEqual(third['hardware']['sensors']['temp_motor']['type'], "temperature")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,284 @@
+"""
+Unit tests for the inspection database module
+"""
+
+import math
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from src.utils.database import InspectionDatabase, _SCHEMA_VERSION
+
+# Schema written by the first release, before schema versions were tracked
+BASELINE_SCHEMA = '''
+    CREATE TABLE inspections (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        elevator_id TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        inspector TEXT,
+        safety_level TEXT NOT NULL,
+        critical_issues INTEGER NOT NULL,
+        warnings INTEGER NOT NULL,
+        passed INTEGER NOT NULL,
+        compliance_percentage REAL NOT NULL,
+        report_path TEXT,
+        notes TEXT
+    );
+    CREATE TABLE inspection_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        inspection_id INTEGER NOT NULL,
+        item_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        category TEXT NOT NULL,
+        criticality TEXT NOT NULL,
+        status TEXT NOT NULL,
+        value TEXT,
+        FOREIGN KEY (inspection_id) REFERENCES inspections (id)
+    );
+'''
+
+
+class TestInspectionDatabase(unittest.TestCase):
+    """Tests for the InspectionDatabase class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "inspections.db")
+        self.db = InspectionDatabase(self.db_path)
+        
+        self.analysis = {
+            "safety_level": "warning",
+            "critical_issues": 0,
+            "warnings": 1,
+            "passed": 1,
+            "compliance_percentage": 50.0
+        }
+    
+    def tearDown(self):
+        """Clean up the temporary database"""
+        self.db.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def index_names(self):
+        """Names of the indexes in the test database"""
+        rows = self.db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        return sorted(name for name, in rows if not name.startswith('sqlite_'))
+    
+    def test_fresh_database(self):
+        """Test a new database gets the current schema and version"""
+        version = self.db.conn.execute("PRAGMA user_version").fetchone()[0]
+        
+        self.assertEqual(version, _SCHEMA_VERSION)
+        self.assertEqual(self.index_names(), ['idx_inspections_elev_ts', 'idx_items_inspection'])
+        self.assertEqual(self.db.get_elevator_history("E1"), [])
+    
+    def test_migrate_baseline_database(self):
+        """Test a database written by the first release is migrated with its data"""
+        self.db.close()
+        os.remove(self.db_path)
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(BASELINE_SCHEMA)
+        conn.execute(
+            "INSERT INTO inspections VALUES (1, 'E1', '2024-01-02T03:04:05.678901', 'bob', "
+            "'critical', 1, 0, 1, 50.0, 'report.pdf', 'notes')"
+        )
+        conn.executemany(
+            "INSERT INTO inspection_items VALUES (?, 1, ?, ?, ?, ?, ?, ?)",
+            [(1, 'motor_temp', 'Motor', 'mechanical', 'high', 'fail', '75.5'),
+             (2, 'door', 'Door', '3', 'critical', 'pass', 'true'),
+             (3, 'vibration', 'Vibration', 'custom', 'low', 'error', 'NaN')]
+        )
+        conn.commit()
+        conn.close()
+        
+        self.db = InspectionDatabase(self.db_path)
+        inspection = self.db.get_inspection(1)
+        items = inspection.pop('items')
+        
+        self.assertEqual(self.db.conn.execute("PRAGMA user_version").fetchone()[0], _SCHEMA_VERSION)
+        self.assertEqual(inspection, {
+            'id': 1, 'elevator_id': 'E1', 'timestamp': '2024-01-02T03:04:05',
+            'inspector': 'bob', 'safety_level': 'critical', 'critical_issues': 1,
+            'warnings': 0, 'passed': 1, 'compliance_percentage': 50.0,
+            'report_path': 'report.pdf', 'notes': 'notes'
+        })
+        self.assertEqual([(item['category'], item['criticality'], item['status']) for item in items],
+                         [('mechanical', 'high', 'fail'), ('3', 'critical', 'pass'),
+                          ('custom', 'low', 'error')])
+        self.assertEqual(items[0]['value'], 75.5)
+        self.assertIs(items[1]['value'], True)
+        self.assertTrue(math.isnan(items[2]['value']))
+        self.assertEqual(self.index_names(), ['idx_inspections_elev_ts', 'idx_items_inspection'])
+        
+        # New inspections follow the migrated one
+        self.assertEqual(self.db.save_inspection("E1", [], self.analysis), 2)
+    
+    def test_reopen_skips_schema_setup(self):
+        """Test reopening a database keeps its data"""
+        inspection_id = self.db.save_inspection("E1", [], self.analysis, inspector="bob")
+        self.db.close()
+        
+        self.db = InspectionDatabase(self.db_path)
+        
+        self.assertEqual(self.db.get_inspection(inspection_id)['inspector'], "bob")
+    
+    def test_save_and_get_inspection(self):
+        """Test an inspection and its items are read back as saved"""
+        results = [
+            {"item_id": "motor_temp", "name": "Motor Temperature", "status": "pass",
+             "value": 42.5, "category": "mechanical", "criticality": "high"},
+            {"item_id": "door", "name": "Door", "status": "error", "value": None,
+             "category": "safety", "criticality": "critical"}
+        ]
+        
+        inspection_id = self.db.save_inspection("E1", results, self.analysis,
+                                                report_path="report.pdf", inspector="bob",
+                                                notes="notes")
+        inspection = self.db.get_inspection(inspection_id)
+        
+        self.assertEqual(inspection['elevator_id'], "E1")
+        self.assertEqual(inspection['safety_level'], "warning")
+        self.assertEqual(inspection['inspector'], "bob")
+        self.assertEqual(inspection['report_path'], "report.pdf")
+        self.assertEqual(
+            [{key: item[key] for key in results[0]} for item in inspection['items']],
+            results
+        )
+    
+    def test_get_missing_inspection(self):
+        """Test retrieving an inspection that does not exist"""
+        with self.assertRaises(ValueError):
+            self.db.get_inspection(1)
+    
+    def test_failed_save_rolls_back(self):
+        """Test an inspection with an invalid item is not saved at all"""
+        with self.assertRaises(KeyError):
+            self.db.save_inspection("E1", [{"name": "No ID"}], self.analysis)
+        
+        self.assertEqual(self.db.get_elevator_history("E1"), [])
+        self.assertFalse(self.db.conn.in_transaction)
+    
+    def test_elevator_history(self):
+        """Test history is newest first, limited, and per elevator"""
+        records = [
+            dict(self.analysis, elevator_id=elevator_id, timestamp=timestamp, items=[])
+            for elevator_id, timestamp in [("E1", 1000), ("E1", 3000), ("E2", 2000), ("E1", 2000)]
+        ]
+        self.db.bulk_import(records)
+        
+        history = self.db.get_elevator_history("E1", limit=2)
+        everything = list(self.db.iter_elevator_history("E1", limit=None))
+        
+        self.assertEqual([record['id'] for record in history], [2, 4])
+        self.assertEqual([record['id'] for record in everything], [2, 4, 1])
+        self.assertEqual(everything[2]['timestamp'], datetime.fromtimestamp(1000).isoformat())
+    
+    def test_bulk_import(self):
+        """Test records in the get_inspection layout can be imported again"""
+        results = [{"item_id": "door", "name": "Door", "status": "pass", "value": True}]
+        inspection_id = self.db.save_inspection("E1", results, self.analysis)
+        record = self.db.get_inspection(inspection_id)
+        
+        self.assertEqual(self.db.bulk_import([record, dict(record, elevator_id="E2")]), 2)
+        
+        imported = self.db.get_elevator_history("E2")[0]
+        self.assertEqual(imported['timestamp'], record['timestamp'])
+        self.assertEqual(self.db.get_inspection(imported['id'])['items'][0]['value'], True)
+    
+    def test_bulk_mode_restores_indexes_on_error(self):
+        """Test a failing bulk block is rolled back with its indexes"""
+        with self.assertRaises(RuntimeError):
+            with self.db.bulk_mode() as cursor:
+                cursor.execute("INSERT INTO inspections (elevator_id, timestamp, safety_level, "
+                               "critical_issues, warnings, passed, compliance_percentage) "
+                               "VALUES ('E1', 0, 0, 0, 0, 0, 0)")
+                self.assertEqual(self.index_names(), [])
+                raise RuntimeError("import failed")
+        
+        self.assertEqual(self.index_names(), ['idx_inspections_elev_ts', 'idx_items_inspection'])
+        self.assertEqual(self.db.get_elevator_history("E1"), [])
+    
+    def test_save_inside_bulk_mode(self):
+        """Test saves inside a bulk block join its transaction"""
+        with self.db.bulk_mode():
+            first = self.db.save_inspection("E1", [], self.analysis)
+            with self.assertRaises(KeyError):
+                self.db.save_inspection("E1", [{"name": "No ID"}], self.analysis)
+            second = self.db.save_inspection("E1", [], self.analysis)
+        
+        self.assertEqual([record['id'] for record in self.db.get_elevator_history("E1")],
+                         [second, first])
+        self.assertEqual(self.index_names(), ['idx_inspections_elev_ts', 'idx_items_inspection'])
+        
+        # A failing bulk block also undoes the saves made inside it
+        with self.assertRaises(RuntimeError):
+            with self.db.bulk_mode():
+                self.db.save_inspection("E2", [], self.analysis)
+                raise RuntimeError("import failed")
+        
+        self.assertEqual(self.db.get_elevator_history("E2"), [])
+        self.assertFalse(self.db.conn.in_transaction)
+    
+    def test_threads_do_not_see_open_transactions(self):
+        """Test another thread reading during a write sees only committed data"""
+        seen = []
+        
+        def read_history():
+            seen.append(len(self.db.get_elevator_history("E1")))
+        
+        with self.db.bulk_mode():
+            self.db.save_inspection("E1", [], self.analysis)
+            reader = threading.Thread(target=read_history)
+            reader.start()
+            reader.join()
+        
+        reader = threading.Thread(target=read_history)
+        reader.start()
+        reader.join()
+        
+        self.assertEqual(seen, [0, 1])
+    
+    def test_item_value_round_trip(self):
+        """Test item values read back with their type, including non-finite floats"""
+        values = [42.5, 7, True, "SIMULATED", {"a": [1, 2]}, math.inf, -math.inf, math.nan,
+                  2 ** 60 + 1, 2 ** 64, -2 ** 70]
+        results = [
+            {"item_id": f"item_{i}", "name": f"Item {i}", "status": "pass", "value": value}
+            for i, value in enumerate(values)
+        ]
+        
+        inspection_id = self.db.save_inspection("E1", results, self.analysis)
+        stored = [item['value'] for item in self.db.get_inspection(inspection_id)['items']]
+        
+        self.assertEqual(stored[:7], values[:7])
+        self.assertIsInstance(stored[0], float)
+        self.assertIsInstance(stored[1], int)
+        self.assertIs(stored[2], True)
+        self.assertTrue(math.isnan(stored[7]))
+        self.assertEqual(stored[8:], values[8:])
+        self.assertTrue(all(isinstance(value, int) for value in stored[8:]))
+    
+    def test_values_outside_vocabulary(self):
+        """Test categories and criticalities outside the known names are kept as text"""
+        results = [
+            {"item_id": "a", "name": "A", "status": "pass", "value": None,
+             "category": "3", "criticality": "1"},
+            {"item_id": "b", "name": "B", "status": "warning", "value": None,
+             "category": "custom", "criticality": 2}
+        ]
+        
+        inspection_id = self.db.save_inspection("E1", results, self.analysis)
+        items = self.db.get_inspection(inspection_id)['items']
+        
+        self.assertEqual([(item['category'], item['criticality']) for item in items],
+                         [("3", "1"), ("custom", "2")])
+        self.assertEqual([item['status'] for item in items], ["pass", "warning"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Unit tests for the elevator interface module
+"""
+
+import sys
+import time
+import unittest
+from src.hardwareelevator import hardwaresensors
+
+# The interface imports the sensor module by its package path,
+# src.hardware.sensors; in this tree it lives in src/hardwareelevator
+sys.modules.setdefault('src.hardware.sensors', hardwaresensors)
+
+from src.hardwareelevator.nterface import ElevatorInterface, connect_all
+
+
+class TestConnectAll(unittest.TestCase):
+    """Tests for the connect_all function"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.hardware_config = {
+            "sensors": {
+                "temp_motor": {"type": "temperature"}
+            }
+        }
+    
+    def test_connect_all(self):
+        """Test every elevator is connected and results keep their order"""
+        elevators = [
+            ElevatorInterface("E1", self.hardware_config, auto_connect=False),
+            ElevatorInterface("E2", {"sensors": {"broken": {}}}, auto_connect=False),
+            ElevatorInterface("E3", self.hardware_config, auto_connect=False)
+        ]
+        
+        self.assertFalse(any(elevator.connected for elevator in elevators))
+        
+        results = connect_all(elevators)
+        
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual([elevator.connected for elevator in elevators], results)
+    
+    def test_connect_all_empty(self):
+        """Test connecting no elevators"""
+        self.assertEqual(connect_all([]), [])
+    
+    def test_connect_all_overlaps_connections(self):
+        """Test simulated connection delays overlap instead of adding up"""
+        config = dict(self.hardware_config, simulate_connect_delay=True)
+        elevators = [ElevatorInterface(f"E{i}", config, auto_connect=False) for i in range(4)]
+        
+        start = time.monotonic()
+        results = connect_all(elevators)
+        elapsed = time.monotonic() - start
+        
+        self.assertEqual(results, [True] * 4)
+        # Four sequential connections would take 2 seconds
+        self.assertLess(elapsed, 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit tests for the safety analyzer module
+"""
+
+import unittest
+from src.inspection.checklist import CheckResult
+from src.inspection.safety_analyzer import SafetyAnalyzer
+
+
+def make_result(item_id, name, value, status, category, error=None):
+    """Build an inspection result for a test"""
+    return CheckResult(item_id=item_id, name=name, type="sensor", value=value,
+                       status=status, timestamp="2024-01-01T00:00:00",
+                       category=category, criticality="high", error=error)
+
+
+class TestSafetyAnalyzer(unittest.TestCase):
+    """Tests for the SafetyAnalyzer class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.analyzer = SafetyAnalyzer({
+            "max_critical_issues": 0,
+            "max_warnings": 2
+        })
+        
+        self.results = [
+            make_result("motor_temp", "Motor Temperature", 42.0, "pass", "mechanical"),
+            make_result("vibration", "Motor Vibration", 4.5, "warning", "mechanical"),
+            make_result("door_operation", "Door Operation", None, "error", "safety",
+                        error="Sensor error")
+        ]
+    
+    def test_analyze_warning(self):
+        """Test analysis of results with a warning"""
+        analysis = self.analyzer.analyze(self.results)
+        
+        self.assertEqual(analysis['safety_level'], 'warning')
+        self.assertEqual(analysis['passed'], 1)
+        self.assertEqual(analysis['warnings'], 1)
+        self.assertEqual(analysis['errors'], 1)
+        self.assertEqual(analysis['total_checks'], 3)
+        self.assertEqual(analysis['compliance_percentage'], 50.0)
+        self.assertEqual(analysis['warning_items'],
+                         [{'name': 'Motor Vibration', 'value': 4.5, 'category': 'mechanical'}])
+        self.assertEqual(analysis['error_items'],
+                         [{'name': 'Door Operation', 'error': 'Sensor error', 'category': 'safety'}])
+    
+    def test_analyze_critical(self):
+        """Test analysis of results with a failed check"""
+        self.results[0].status = 'fail'
+        
+        analysis = self.analyzer.analyze(self.results)
+        
+        self.assertEqual(analysis['safety_level'], 'critical')
+        self.assertEqual(analysis['critical_issues'], 1)
+        self.assertEqual(analysis['critical_items'][0]['name'], 'Motor Temperature')
+    
+    def test_analyze_repeated(self):
+        """Test repeated analyses are independent of each other"""
+        first = self.analyzer.analyze(self.results)
+        first['warning_items'].clear()
+        
+        second = self.analyzer.analyze(self.results)
+        
+        self.assertEqual(len(second['warning_items']), 1)
+        
+        # A changed value is reflected in the next analysis
+        self.results[1].value = 5.0
+        third = self.analyzer.analyze(self.results)
+        self.assertEqual(third['warning_items'][0]['value'], 5.0)
+    
+    def test_analyze_stored_items(self):
+        """Test analysis of plain result dictionaries, as read back from the database"""
+        items = [
+            {"id": i, "item_id": r.item_id, "name": r.name, "category": r.category,
+             "criticality": r.criticality, "status": r.status, "value": r.value}
+            for i, r in enumerate(self.results, 1)
+        ]
+        
+        analysis = self.analyzer.analyze(items)
+        
+        self.assertEqual(analysis['safety_level'], 'warning')
+        self.assertEqual(analysis['compliance_percentage'], 50.0)
+        self.assertEqual(analysis['warning_items'],
+                         [{'name': 'Motor Vibration', 'value': 4.5, 'category': 'mechanical'}])
+        # Stored items carry no error message
+        self.assertEqual(analysis['error_items'],
+                         [{'name': 'Door Operation', 'error': 'Unknown error', 'category': 'safety'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
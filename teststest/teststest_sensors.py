@@ -0,0 +1,167 @@
+"""
+Unit tests for the sensor manager module
+"""
+
+import unittest
+from unittest.mock import MagicMock
+from src.hardwareelevator.hardwaresensors import SensorManager
+
+
+class TestSensorManager(unittest.TestCase):
+    """Tests for the SensorManager class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sensor_config = {
+            "temp_motor": {
+                "type": "temperature",
+                "location": "motor",
+                "unit": "celsius"
+            },
+            "speed": {
+                "type": "speed",
+                "unit": "m/s",
+                "cache_ttl": 0
+            }
+        }
+        
+        self.sensor_manager = SensorManager(self.sensor_config)
+        self.sensor_manager.connect_sensors()
+    
+    def test_connect_sensors(self):
+        """Test connecting to configured sensors"""
+        self.assertEqual(set(self.sensor_manager.connected_sensors), {"temp_motor", "speed"})
+        self.assertTrue(self.sensor_manager.connected_sensors["temp_motor"]["connected"])
+    
+    def test_connect_sensors_invalid_config(self):
+        """Test a sensor without a type is skipped and reported"""
+        manager = SensorManager({
+            "temp_motor": {"type": "temperature"},
+            "broken": {"location": "motor"}
+        })
+        
+        self.assertFalse(manager.connect_sensors())
+        self.assertEqual(set(manager.connected_sensors), {"temp_motor"})
+    
+    def test_unknown_sensor(self):
+        """Test reading from a sensor that is not connected"""
+        self.assertIsNone(self.sensor_manager.get_reading("missing"))
+    
+    def test_reading_cached_within_ttl(self):
+        """Test repeated reads reuse the cached value"""
+        self.sensor_manager._next_uniform = MagicMock(side_effect=[0.2, 0.8])
+        
+        first = self.sensor_manager.get_reading("temp_motor")
+        second = self.sensor_manager.get_reading("temp_motor")
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.sensor_manager._next_uniform.call_count, 1)
+    
+    def test_sensor_cache_ttl_override(self):
+        """Test a sensor's own cache_ttl disables caching"""
+        self.sensor_manager._next_uniform = MagicMock(side_effect=[0.2, 0.8])
+        
+        first = self.sensor_manager.get_reading("speed")
+        second = self.sensor_manager.get_reading("speed")
+        
+        self.assertAlmostEqual(first, 1.6)
+        self.assertAlmostEqual(second, 1.9)
+    
+    def test_seeded_readings_reproducible(self):
+        """Test managers with the same seed produce the same readings"""
+        readings = []
+        for _ in range(2):
+            manager = SensorManager(self.sensor_config, seed=42)
+            manager.connect_sensors()
+            readings.append((manager.get_reading("temp_motor"),
+                             manager.get_readings_batch(["temp_motor", "speed"])))
+        
+        self.assertEqual(readings[0], readings[1])
+    
+    def test_lookup_table_refilled_when_exhausted(self):
+        """Test uniform samples keep coming after the lookup table runs out"""
+        first = self.sensor_manager._next_uniform()
+        lut = self.sensor_manager._lut
+        self.sensor_manager._lut_pos = len(lut)
+        
+        sample = self.sensor_manager._next_uniform()
+        
+        self.assertTrue(0.0 <= first < 1.0)
+        self.assertTrue(0.0 <= sample < 1.0)
+        self.assertIsNot(self.sensor_manager._lut, lut)
+        self.assertEqual(self.sensor_manager._lut_pos, 1)
+    
+    def test_polling(self):
+        """Test readings come from the background poller while it runs"""
+        self.sensor_manager.start_polling(interval=60)
+        try:
+            latest = self.sensor_manager._latest
+            self.assertEqual(set(latest), {"temp_motor", "speed"})
+            self.assertEqual(self.sensor_manager.get_reading("speed"), latest["speed"])
+            self.assertEqual(self.sensor_manager.get_reading("speed"), latest["speed"])
+        finally:
+            self.sensor_manager.stop_polling()
+        
+        self.assertIsNone(self.sensor_manager._poll_thread)
+    
+    def test_get_readings_batch(self):
+        """Test reading several sensors in one batch"""
+        readings = self.sensor_manager.get_readings_batch(["temp_motor", "speed", "missing"])
+        
+        self.assertEqual(set(readings), {"temp_motor", "speed", "missing"})
+        self.assertTrue(35.0 <= readings["temp_motor"] <= 50.0)
+        self.assertTrue(1.5 <= readings["speed"] <= 2.0)
+        self.assertIsNone(readings["missing"])
+        
+        # Batch readings refresh the cache used by single reads
+        self.assertEqual(self.sensor_manager.get_reading("temp_motor"), readings["temp_motor"])
+    
+    def test_get_readings_batch_boolean_sensors(self):
+        """Test boolean sensors report booleans in a batch"""
+        manager = SensorManager({
+            "door_sensor": {"type": "door_sensor"},
+            "weight": {"type": "weight", "capacity": 500}
+        })
+        manager.connect_sensors()
+        
+        readings = manager.get_readings_batch(["door_sensor", "weight"])
+        
+        self.assertIsInstance(readings["door_sensor"], bool)
+        self.assertTrue(0.0 <= readings["weight"] <= 500.0)
+    
+    def test_get_readings_batch_seeded(self):
+        """Test batch readings with the same simulation seed repeat"""
+        config = dict(self.sensor_config, door_sensor={"type": "door_sensor"})
+        
+        def read_seeded():
+            manager = SensorManager(config, seed=3)
+            manager.connect_sensors()
+            return manager.get_readings_batch(list(config))
+        
+        readings = read_seeded()
+        
+        self.assertEqual(read_seeded(), readings)
+        self.assertIsInstance(readings["door_sensor"], bool)
+    
+    def test_get_readings_batch_before_connect(self):
+        """Test a batch read before connecting reports every sensor as unavailable"""
+        manager = SensorManager(self.sensor_config)
+        
+        self.assertEqual(manager.get_readings_batch(["temp_motor", "speed"]),
+                         {"temp_motor": None, "speed": None})
+        
+        # Polling before connecting has nothing to read either
+        manager.start_polling(interval=60)
+        thread = manager._poll_thread
+        try:
+            self.assertTrue(all(value is None for value in manager._latest.values()))
+            self.assertIsNone(manager.get_reading("temp_motor"))
+        finally:
+            manager.stop_polling()
+        
+        self.assertIsNone(manager._poll_thread)
+        self.assertFalse(thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()